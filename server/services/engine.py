@@ -69,7 +69,9 @@ async def run_pipeline(req: RunRequest) -> RunResponse:
     
     # 5. Run Forward Simulation (Future Outlook)
     # Used for "Cone" visualization
-    gen_engine.fit(prices_series) # Ensure fitted to latest
+    # run_ex_ante_analysis already refits on the full history when it returns a verdict
+    if "verdict" not in ex_ante_results:
+        gen_engine.fit(prices_series) # Ensure fitted to latest
     forward_paths = gen_engine.generate_paths(start_price=spot, n_days=req.horizon)
     
     # 6. Generate Bands for Chart
@@ -6,18 +6,23 @@ from typing import List, Dict, Tuple, Optional
 # Import our new components
 from server.services.generative.ssm import StateSpaceModel
 from server.services.generative.regime import RegimeDetector
+from server.services.generative.particle import StochasticVolatilityFilter
 
 class GenerativeEngine:
     """
     Orchestrates the Generative Market Model.
-    1. Fits SSM to get latent trend/vol.
-    2. Fits HMM to detect regimes.
-    3. Simulates future paths (or ex-ante past paths) using Regime-Switching Random Walk.
+    1. Fits SSM to get latent trend/velocity.
+    2. Fits Particle Filter to get the drift and stochastic volatility distribution.
+    3. Fits HMM to detect regimes.
+    4. Simulates future paths (or ex-ante past paths) using a Stochastic Volatility
+       Random Walk whose volatility reverts to the current regime's level.
     """
     def __init__(self, n_paths: int = 1000, horizon: int = 252):
         self.n_paths = n_paths
         self.horizon = horizon
         self.ssm = StateSpaceModel()
+        # Particles sized to the path count: only starting vols are sampled
+        self.sv_filter = StochasticVolatilityFilter(n_particles=max(n_paths, 1000))
         self.regime_detector = RegimeDetector()
         
     def fit(self, prices: pd.Series):
@@ -28,7 +33,10 @@ class GenerativeEngine:
         log_prices = np.log(prices)
         self.ssm_states = self.ssm.fit(log_prices)
         
-        # 2. HMM for Regimes
+        # 2. Particle Filter for Stochastic Volatility
+        self.sv_states = self.sv_filter.fit(log_prices.diff().dropna())
+
+        # 3. HMM for Regimes
         returns = prices.pct_change().dropna()
         self.regime_detector.fit(returns)
         self.current_regime = self.regime_detector.predict_regime(returns).iloc[-1]
@@ -37,40 +45,42 @@ class GenerativeEngine:
         self.last_price = prices.iloc[-1]
         self.last_trend = self.ssm_states['trend'].iloc[-1]
         self.last_velocity = self.ssm_states['velocity'].iloc[-1]
-        self.resid_std = self.ssm_states['residual'].std()
 
     def generate_paths(self, start_price: float, n_days: int, regime_override: str = None) -> np.ndarray:
         """
         Generates N_PATHS x N_DAYS price matrix.
-        Uses a simplified Regime-Switching Geometric Brownian Motion.
+        Uses a Geometric Brownian Motion with regime-conditioned stochastic volatility.
+        `regime_override` replaces the detected current regime label.
         """
         # Get params for current regime (or override)
         # Note: In a full implementation, we'd simulate regime transitions day-by-day.
-        # For v1, we'll assume the starting regime persists or slowly decays to mean.
-        
-        # Simplified: Use the SSM's last velocity as the 'drift' center, 
-        # but modulated by the Regime's volatility character.
+        # For v1, we'll assume the starting regime persists: vol reverts to its level.
+        regime = regime_override or self.current_regime
+        regime_vol = self.regime_detector.get_current_regime_params(regime)['mu_vol']
         
-        # Base Drift (from Kalman)
-        mu = self.last_velocity 
+        # Base Drift (from Particle Filter), annual arithmetic drift to match dt:
+        # daily mean log-return plus the Ito term, times 252.
+        # The Kalman velocity is too noisy day-to-day to annualize.
+        mu = (self.sv_filter.mu + 0.5 * self.sv_filter.long_run_variance) * 252
         
-        # Volatility (from Regime + Residuals)
-        # We blend the regime's vol with the recent residual vol
-        # For now, let's use the recent residual vol scaled by a regime factor
-        regime_factor = 1.0
-        if "High Vol" in str(self.current_regime): regime_factor = 1.5
-        elif "Crisis" in str(self.current_regime): regime_factor = 3.0
+        # Volatility (from Particle Filter + Regime)
+        # Each path starts from a volatility state sampled from the filtered
+        # distribution, so the current level is not scaled by the regime again
+        # (the HMM's High Vol / Crisis labels key on the same recent vol).
+        # The regime only sets the long-run level the vol reverts to.
         
-        sigma = self.resid_std * regime_factor
+        # N_PATHS x N_DAYS daily vol, annualized
+        sigma = self.sv_filter.simulate_volatility(
+            self.n_paths, n_days, long_run_vol=regime_vol) * np.sqrt(252)
         
         dt = 1/252
         
         # Vectorized Simulation
-        # dS/S = mu*dt + sigma*dW
-        # S_t = S_0 * exp( (mu - 0.5*sigma^2)*t + sigma*W_t )
+        # dS/S = mu*dt + sigma_t*dW
+        # S_t = S_0 * exp( sum (mu - 0.5*sigma_t^2)*dt + sigma_t*dW_t )
         
         # Random shocks
-        Z = np.random.normal(0, 1, size=(self.n_paths, n_days))
+        Z = self.sv_filter.rng.standard_normal((self.n_paths, n_days))
         
         # Cumulative returns
         drift_term = (mu - 0.5 * sigma**2) * dt
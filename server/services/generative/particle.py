@@ -0,0 +1,229 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+class StochasticVolatilityFilter:
+    """
+    Bootstrap Particle Filter for a Stochastic Volatility model.
+    Tracks the latent log-variance (h) of daily log-returns, which the
+    linear Kalman filter in StateSpaceModel cannot represent.
+
+    r_t = mu + exp(h_t / 2) * eps_t
+    h_t = m + phi * (h_t-1 - m) + sigma_eta * eta_t
+
+    Particles are held as one contiguous float64 array; propagate, weight
+    and resample are vectorized, so only the time loop runs in Python.
+    """
+    def __init__(self, n_particles: int = 10000, phi: float = 0.98,
+                 sigma_eta: float = 0.15, random_state: Optional[int] = 42):
+        self.n_particles = n_particles
+        self.phi = phi
+        self.sigma_eta = sigma_eta
+        self.rng = np.random.default_rng(random_state)
+        self.stationary_std = sigma_eta / np.sqrt(1. - phi**2) # Std of h around m
+
+        # Set by fit()
+        self.mu = 0.0
+        self.m = 0.0
+        self.particles = None # Filtered log-variance particles at the last step
+        self.weights = None   # Normalized weights for `particles`
+
+    def _systematic_resample(self, weights: np.ndarray) -> np.ndarray:
+        """
+        Returns ancestor indices using a single uniform draw (low variance).
+        """
+        n = weights.shape[0]
+        positions = (self.rng.random() + np.arange(n)) / n
+        cumulative = np.cumsum(weights)
+        cumulative[-1] = 1.0 # Guard against round-off
+        return np.searchsorted(cumulative, positions)
+
+    def fit(self, returns: pd.Series) -> pd.DataFrame:
+        """
+        Runs the filter over a series of daily log-returns.
+
+        Args:
+            returns: A pandas Series of daily log-returns. NaNs are dropped.
+
+        Returns:
+            DataFrame with 'vol' (filtered daily volatility), 'vol_std'
+            and 'ess' (effective sample size before resampling)
+        """
+        returns = returns.dropna()
+        if returns.empty:
+            raise ValueError("No returns to filter")
+
+        r = returns.values.astype(np.float64)
+        n = self.n_particles
+
+        self.mu = r.mean()
+        r = r - self.mu
+        # h is Gaussian with variance stationary_std^2, so E[exp(h)] equals
+        # the sample variance only after the lognormal correction
+        self.m = np.log(r.var() + 1e-12) - 0.5 * self.stationary_std**2
+
+        # Draw initial particles from the stationary distribution of h
+        h = self.m + self.stationary_std * self.rng.standard_normal(n)
+        # Weights live in log space so tail particles never underflow to log(0)
+        log_w = np.full(n, -np.log(n))
+
+        vols = np.empty(len(r))
+        vol_stds = np.empty(len(r))
+        ess = np.empty(len(r))
+
+        for t, r_t in enumerate(r):
+            # Propagate
+            h = self.m + self.phi * (h - self.m) + self.sigma_eta * self.rng.standard_normal(n)
+
+            # Weight: log N(r_t; 0, exp(h)) up to a constant
+            sigma = np.exp(0.5 * h)
+            log_w -= 0.5 * h + 0.5 * r_t**2 / (sigma * sigma)
+
+            # Normalize (logsumexp); linear weights are only needed for moments
+            log_w_max = log_w.max()
+            w = np.exp(log_w - log_w_max)
+            w_sum = w.sum()
+            w /= w_sum
+            log_w -= log_w_max + np.log(w_sum)
+
+            vols[t] = w @ sigma
+            vol_stds[t] = np.sqrt(max(w @ sigma**2 - vols[t]**2, 0.))
+            ess[t] = 1. / (w @ w)
+
+            # Resample when the weights degenerate
+            if ess[t] < 0.5 * n:
+                h = h[self._systematic_resample(w)]
+                w = np.full(n, 1. / n)
+                log_w = np.full(n, -np.log(n))
+
+        self.particles = h
+        self.weights = w
+
+        return pd.DataFrame({
+            'vol': vols,
+            'vol_std': vol_stds,
+            'ess': ess
+        }, index=returns.index)
+
+    @property
+    def long_run_variance(self) -> float:
+        """
+        Stationary E[exp(h)]: the long-run daily return variance.
+        """
+        return np.exp(self.m + 0.5 * self.stationary_std**2)
+
+    def sample_log_variance(self, n_samples: int) -> np.ndarray:
+        """
+        Draws log-variance states from the last filtered distribution.
+        """
+        if self.particles is None:
+            raise ValueError("Filter has not been fitted")
+
+        return self.rng.choice(self.particles, size=n_samples, p=self.weights)
+
+    def simulate_volatility(self, n_paths: int, n_days: int,
+                            long_run_vol: Optional[float] = None) -> np.ndarray:
+        """
+        Returns an N_PATHS x N_DAYS matrix of daily volatilities.
+        Each path starts from a sampled filtered state and evolves under
+        the AR(1) log-variance dynamics (fixed phi/sigma_eta, fitted m).
+
+        Args:
+            long_run_vol: Optional daily mean vol to revert to instead of
+                the fitted level (e.g. a regime's typical vol).
+        """
+        h0 = self.sample_log_variance(n_paths)
+
+        m = self.m
+        if long_run_vol is not None:
+            # E[exp(h/2)] = exp(m/2 + s^2/8) for Gaussian h
+            m = 2. * np.log(long_run_vol) - 0.25 * self.stationary_std**2
+
+        # Step the AR(1) deviation from the long-run mean, vectorized across paths
+        h = np.empty((n_paths, n_days))
+        shocks = self.sigma_eta * self.rng.standard_normal((n_paths, n_days))
+        dev = h0 - m
+        for t in range(n_days):
+            dev = self.phi * dev + shocks[:, t]
+            h[:, t] = dev
+        h += m
+
+        return np.exp(0.5 * h)
+
+    def extract_features(self, df: pd.DataFrame) -> Dict[str, float]:
+        """
+        Returns key metrics from the latest filtered state.
+        'sigma_sv_long_run_rms' is sqrt(E[exp(h)]), i.e. the sample std.
+        """
+        return {
+            'sigma_sv': df['vol'].iloc[-1],
+            'sigma_sv_std': df['vol_std'].iloc[-1],
+            'sigma_sv_long_run_rms': np.sqrt(self.long_run_variance)
+        }
+
+def _fit_filter(args):
+    """
+    Process-pool worker: fits one ticker and returns the fitted filter.
+    """
+    returns, kwargs = args
+    sv_filter = StochasticVolatilityFilter(**kwargs)
+    states = sv_filter.fit(returns)
+    return sv_filter, states
+
+def fit_many(returns_by_ticker: Dict[str, pd.Series], n_workers: Optional[int] = None,
+             random_state: Optional[int] = 42,
+             **kwargs) -> Dict[str, Tuple[StochasticVolatilityFilter, pd.DataFrame]]:
+    """
+    Fits one StochasticVolatilityFilter per ticker, splitting tickers
+    across processes. Use n_workers=1 to run in the calling process.
+    Each ticker gets an independent seed spawned from `random_state`.
+
+    Returns:
+        Dict of ticker -> (fitted filter, filtered states DataFrame)
+    """
+    tickers = list(returns_by_ticker)
+    seeds = np.random.SeedSequence(random_state).spawn(len(tickers))
+    jobs = [(returns_by_ticker[t], dict(kwargs, random_state=int(seed.generate_state(1)[0])))
+            for t, seed in zip(tickers, seeds)]
+
+    if n_workers == 1 or len(jobs) <= 1:
+        results = [_fit_filter(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(_fit_filter, jobs))
+
+    return dict(zip(tickers, results))
+
+if __name__ == "__main__":
+    # Self-check: recover a synthetic SV path, time the filter and make sure
+    # the process split matches the in-process run.
+    # Run with: python -m server.services.generative.particle
+    import time
+
+    rng = np.random.default_rng(0)
+    n_days, phi, sigma_eta = 1260, 0.98, 0.15
+    m_true = np.log(0.01**2)
+    h_true = np.empty(n_days)
+    h_true[0] = m_true
+    for t in range(1, n_days):
+        h_true[t] = m_true + phi * (h_true[t - 1] - m_true) + sigma_eta * rng.standard_normal()
+    vol_true = np.exp(0.5 * h_true)
+    returns = pd.Series(vol_true * rng.standard_normal(n_days))
+
+    sv_filter = StochasticVolatilityFilter(n_particles=10000)
+    start = time.perf_counter()
+    states = sv_filter.fit(returns)
+    elapsed = time.perf_counter() - start
+
+    corr = np.corrcoef(states['vol'].values, vol_true)[0, 1]
+    print(f"10k particles x {n_days} days: {elapsed:.3f}s, corr(filtered, true vol) = {corr:.3f}")
+    assert corr > 0.7, "Filtered vol does not track the synthetic path"
+    assert elapsed < 1.0, "Filter is slower than the 1s budget"
+
+    by_ticker = {'A': returns, 'B': returns * 2.}
+    serial = fit_many(by_ticker, n_workers=1)
+    parallel = fit_many(by_ticker, n_workers=2)
+    for ticker in by_ticker:
+        assert np.allclose(serial[ticker][1]['vol'], parallel[ticker][1]['vol'])
+    print("fit_many: serial and process-pool runs match")